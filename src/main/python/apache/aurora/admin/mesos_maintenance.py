@@ -27,13 +27,12 @@ class MesosMaintenance(object):
 
   @classmethod
   def group_hosts(cls, hostnames, grouping_function=DEFAULT_GROUPING):
-    try:
-      grouping_function = cls.GROUPING_FUNCTIONS[grouping_function]
-    except KeyError:
+    grouper = cls.GROUPING_FUNCTIONS.get(grouping_function)
+    if grouper is None:
       raise ValueError('Unknown grouping function %s!' % grouping_function)
     groups = defaultdict(set)
     for hostname in hostnames:
-      groups[grouping_function(hostname)].add(hostname)
+      groups[grouper(hostname)].add(hostname)
     return groups
 
   @classmethod
@@ -10,6 +10,11 @@ from gen.apache.aurora.ttypes import (
   TaskQuery,
 )
 
+
+# Built once; the status watcher queries with the same filter on every poll.
+RUNNING_STATES = frozenset([ScheduleStatus.RUNNING])
+
+
 class Instance(object):
   def __init__(self, birthday=None, finished=False):
     self.birthday = birthday
@@ -85,7 +90,10 @@ class InstanceWatcher(object):
       now = self._clock.time()
       tasks_by_instance = dict((task.assignedTask.instanceId, task) for task in running_tasks)
       for instance_id in instance_ids:
-        if instance_id not in finished_instances():
+        # Probe the state dict directly; calling finished_instances() here
+        # would rebuild it once per instance on every poll.
+        state = instance_states.get(instance_id)
+        if state is None or not state.finished:
           running_task = tasks_by_instance.get(instance_id)
           if running_task is not None:
             task_healthy, retriable = health_check.health(running_task)
@@ -116,7 +124,7 @@ class InstanceWatcher(object):
     query.owner = Identity(role=self._job_key.role)
     query.environment = self._job_key.environment
     query.jobName = self._job_key.name
-    query.statuses = set([ScheduleStatus.RUNNING])
+    query.statuses = RUNNING_STATES
 
     query.instanceIds = instance_ids
     try:
@@ -1,5 +1,3 @@
-import collections
-
 from twitter.common import log
 
 class UpdaterConfig(object):
@@ -39,7 +37,8 @@ class FailureThreshold(object):
   def __init__(self, max_per_instance_failures, max_total_failures):
     self._max_per_instance_failures = max_per_instance_failures
     self._max_total_failures = max_total_failures
-    self._failures_by_instance = collections.defaultdict(int)
+    self._failures_by_instance = {}
+    self._exceeded_instance_count = 0
 
 
   def update_failure_counts(self, failed_instances):
@@ -51,27 +50,33 @@ class FailureThreshold(object):
     Returns a list of instances with failure counts exceeding _max_per_instance_failures.
     """
     exceeded_failure_count_instances = []
+    failures_by_instance = self._failures_by_instance
+    max_per_instance_failures = self._max_per_instance_failures
     for instance in failed_instances:
-      self._failures_by_instance[instance] += 1
-      if self._failures_by_instance[instance] > self._max_per_instance_failures:
+      failure_count = failures_by_instance.get(instance, 0) + 1
+      failures_by_instance[instance] = failure_count
+      # Count each instance exactly once, as it first crosses the threshold, so the
+      # aggregate can be maintained incrementally rather than recomputed per check.
+      if failure_count == max_per_instance_failures + 1:
+        self._exceeded_instance_count += 1
         exceeded_failure_count_instances.append(instance)
 
     return exceeded_failure_count_instances
 
   def is_failed_update(self):
     total_failed_instances = self._exceeded_instance_fail_count()
-    is_failed = total_failed_instances > self._max_total_failures
+    if total_failed_instances <= self._max_total_failures:
+      # The common (healthy) case: skip the per-instance walk and formatting.
+      return False
 
-    if is_failed:
-      log.error('%s failed instances observed, maximum allowed is %s' % (total_failed_instances,
-          self._max_total_failures))
-      for instance, failure_count in self._failures_by_instance.items():
-        if failure_count > self._max_per_instance_failures:
-          log.error('%s instance failures for instance %s, maximum allowed is %s' %
-              (failure_count, instance, self._max_per_instance_failures))
-    return is_failed
+    log.error('%s failed instances observed, maximum allowed is %s' % (total_failed_instances,
+        self._max_total_failures))
+    for instance, failure_count in self._failures_by_instance.iteritems():
+      if failure_count > self._max_per_instance_failures:
+        log.error('%s instance failures for instance %s, maximum allowed is %s' %
+            (failure_count, instance, self._max_per_instance_failures))
+    return True
 
   def _exceeded_instance_fail_count(self):
-    """Checks if the per instance failure is greater than a threshold."""
-    return sum(count > self._max_per_instance_failures
-               for count in self._failures_by_instance.values())
+    """Returns the number of instances whose failure count exceeds the threshold."""
+    return self._exceeded_instance_count
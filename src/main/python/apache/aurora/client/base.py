@@ -34,24 +34,25 @@ def check_and_log_locked_response(resp):
     log.info(LOCKED_WARNING)
 
 def deprecation_warning(text):
-  log.warning('')
-  log.warning('*' * 80)
-  log.warning('* The command you ran is deprecated and will soon break!')
-  for line in text.split('\n'):
-    log.warning('* %s' % line)
-  log.warning('*' * 80)
-  log.warning('')
+  # Emit the banner as one record instead of one per line; each log call
+  # formats, locks and flushes the stderr handler separately.
+  lines = ['', '*' * 80, '* The command you ran is deprecated and will soon break!']
+  lines.extend('* %s' % line for line in text.split('\n'))
+  lines.extend(['*' * 80, ''])
+  log.warning('\n'.join(lines))
 
 
 class requires(object):
   @staticmethod
   def wrap_function(fn, fnargs, comparator):
+    # Build the failure message once at decoration time rather than on every call.
+    if fn.__doc__:
+      help = '%s\n\nsee the help subcommand for more details.' % fn.__doc__.partition('\n')[0]
+    else:
+      help = 'Incorrect parameters for %s' % fn.__name__
     @functools.wraps(fn)
     def wrapped_function(args):
       if not comparator(args, fnargs):
-        help = 'Incorrect parameters for %s' % fn.__name__
-        if fn.__doc__:
-          help = '%s\n\nsee the help subcommand for more details.' % fn.__doc__.split('\n')[0]
         die(help)
       return fn(*args)
     return wrapped_function
@@ -135,6 +136,22 @@ def generate_full_usage():
   return 'Available commands:\n\n' + '\n'.join(usage)
 
 
+HELP_OPTIONS = frozenset(['-h', '--help', '--short-help', '--long-help'])
+
+
+def set_usage_if_needed(usage_generator):
+  """Install application usage generated by usage_generator(), unless the
+     command line dispatches straight to a registered command, in which case
+     usage is never rendered and walking every command to build it is wasted
+     startup work.  Empty, help and unknown-command invocations still get the
+     full usage string, as do invocations carrying a help option anywhere on
+     the command line (the option parser renders usage for those)."""
+  args = sys.argv[1:]
+  if (not args or args[0] == 'help' or args[0] not in app.get_commands()
+      or not HELP_OPTIONS.isdisjoint(args)):
+    app.set_usage(usage_generator())
+
+
 def generate_terse_usage():
   """Generate minimal application usage from all registered
      twitter.common.app commands and return as a string."""
@@ -1,4 +1,4 @@
-from apache.aurora.client.base import generate_terse_usage
+from apache.aurora.client.base import generate_terse_usage, set_usage_if_needed
 from apache.aurora.client.commands import admin, help
 from apache.aurora.client.options import add_verbosity_options
 from twitter.common import app
@@ -16,7 +16,7 @@ def main():
 LogOptions.set_stderr_log_level('INFO')
 LogOptions.disable_disk_logging()
 app.set_name('aurora-admin')
-app.set_usage(generate_terse_usage())
+set_usage_if_needed(generate_terse_usage)
 
 
 def proxy_main():
@@ -1,4 +1,4 @@
-from apache.aurora.client.base import generate_terse_usage
+from apache.aurora.client.base import generate_terse_usage, set_usage_if_needed
 from twitter.common import app
 from twitter.common.log.options import LogOptions
 
@@ -26,7 +26,7 @@ def main():
 LogOptions.set_stderr_log_level('INFO')
 LogOptions.disable_disk_logging()
 app.set_name('aurora-client')
-app.set_usage(generate_terse_usage())
+set_usage_if_needed(generate_terse_usage)
 
 
 def proxy_main():
@@ -98,13 +98,22 @@ class CommandLine(object):
     """Add a noun to the application"""
     if not isinstance(noun, Noun):
       raise TypeError('register_noun requires a Noun argument')
-    self.nouns[noun.name] = noun
-
-  def setup_options_parser(self):
-    """ Build the options parsing for the application."""
+    # Interning the name makes the dispatch dict lookup a pointer comparison.
+    self.nouns[intern(str(noun.name))] = noun
+
+  def setup_options_parser(self, noun_name=None):
+    """ Build the options parsing for the application.
+    :param noun_name: if this names a registered noun, only that noun's subparser is
+        built, skipping the parser construction for every other noun. Otherwise parsers
+        for all nouns are built, so that help and error messages can list every command.
+    """
     self.parser = argparse.ArgumentParser()
     subparser = self.parser.add_subparsers(dest='noun')
-    for (name, noun) in self.nouns.items():
+    if noun_name in self.nouns:
+      nouns = [(noun_name, self.nouns[noun_name])]
+    else:
+      nouns = self.nouns.iteritems()
+    for (name, noun) in nouns:
       noun_parser = subparser.add_parser(name, help=noun.help)
       noun.internal_setup_options_parser(noun_parser)
 
@@ -114,17 +123,36 @@ class CommandLine(object):
     """
     pass
 
+  def setup_verb_parser(self, noun, verb):
+    """Build an options parser covering only one verb of one noun, sidestepping the
+    cost of the subparser machinery for commands that cannot be dispatched to."""
+    self.parser = argparse.ArgumentParser(prog='%s %s' % (noun.name, verb.name))
+    noun.setup_options_parser(self.parser)
+    verb.setup_options_parser(self.parser)
+
   def execute(self, args):
     """Execute a command.
     :param args: the command-line arguments for the command. This only includes arguments
         that should be parsed by the application; it does not include sys.argv[0].
     """
     self.register_nouns()
-    self.setup_options_parser()
-    options = self.parser.parse_args(args)
-    if options.noun not in self.nouns:
-      raise ValueError('Unknown command: %s' % options.noun)
-    noun = self.nouns[options.noun]
+    noun = self.nouns.get(intern(args[0])) if args else None
+    verb = noun.verbs.get(intern(args[1])) if noun is not None and len(args) > 1 else None
+    if verb is not None:
+      # The common case: a well-formed "noun verb" invocation only needs a parser for
+      # the options of the matched verb.
+      self.setup_verb_parser(noun, verb)
+      options = self.parser.parse_args(args[2:])
+      options.noun = args[0]
+      options.verb = args[1]
+    else:
+      # Fall back to building parsers for everything, so that argparse can produce
+      # help and error messages listing all of the registered commands.
+      self.setup_options_parser(args[0] if args else None)
+      options = self.parser.parse_args(args)
+      if options.noun not in self.nouns:
+        raise ValueError('Unknown command: %s' % options.noun)
+      noun = self.nouns[options.noun]
     context = noun.create_context()
     context.set_options(options)
     try:
@@ -146,14 +174,14 @@ class Noun(AuroraCommand):
     """Add an operation supported for this noun."""
     if not isinstance(verb, Verb):
       raise TypeError('register_verb requires a Verb argument')
-    self.verbs[verb.name] = verb
+    self.verbs[intern(str(verb.name))] = verb
     verb._register(self)
 
   def internal_setup_options_parser(self, argparser):
     """Internal driver for the options processing framework."""
     self.setup_options_parser(argparser)
     subparser = argparser.add_subparsers(dest='verb')
-    for (name, verb) in self.verbs.items():
+    for (name, verb) in self.verbs.iteritems():
       vparser = subparser.add_parser(name, help=verb.help)
       verb.setup_options_parser(vparser)
 
@@ -1,5 +1,6 @@
 from apache.aurora.client.api.job_monitor import JobMonitor
 from apache.aurora.client.cli import (
+    CommandOption,
     EXIT_INVALID_CONFIGURATION,
     Noun,
     Verb
@@ -34,6 +35,28 @@ def parse_instances(instances):
   return sorted(result)
 
 
+# Option specifications are built once at module load rather than on every
+# dispatch, following the pattern in client.cli.options.
+CREATE_STATES = ('PENDING', 'RUNNING', 'FINISHED')
+
+
+WAIT_UNTIL_OPTION = CommandOption('--wait_until', choices=CREATE_STATES,
+    default='PENDING',
+    help=('Block the client until all the tasks have transitioned into the requested state. '
+                    'Default: PENDING'))
+
+
+INSTANCES_OPTION = CommandOption('--instances', type=parse_instances, dest='instances',
+    default=None,
+    help='A list of instance ids to act on. Can either be a comma-separated list (e.g. 0,1,2) '
+        'or a range (e.g. 0-2) or any combination of the two (e.g. 0-2,5,7-9). If not set, '
+        'all instances will be acted on.')
+
+
+CONFIG_FILE_OPTION = CommandOption('--config', type=str, default=None, dest='config',
+     help='Config file for the job, possibly containing hooks')
+
+
 class CreateJobCommand(Verb):
   @property
   def name(self):
@@ -43,16 +66,11 @@ class CreateJobCommand(Verb):
   def help(self):
     return 'Create a job using aurora'
 
-  CREATE_STATES = ('PENDING', 'RUNNING', 'FINISHED')
-
   def setup_options_parser(self, parser):
     self.add_option(parser, BIND_OPTION)
     self.add_option(parser, BROWSER_OPTION)
     self.add_option(parser, JSON_OPTION)
-    parser.add_argument('--wait_until', choices=self.CREATE_STATES,
-        default='PENDING',
-        help=('Block the client until all the tasks have transitioned into the requested state. '
-                        'Default: PENDING'))
+    self.add_option(parser, WAIT_UNTIL_OPTION)
     self.add_option(parser, JOBSPEC_OPTION)
     self.add_option(parser, CONFIG_OPTION)
 
@@ -81,12 +99,8 @@ class KillJobCommand(Verb):
 
   def setup_options_parser(self, parser):
     self.add_option(parser, BROWSER_OPTION)
-    parser.add_argument('--instances', type=parse_instances, dest='instances', default=None,
-        help='A list of instance ids to act on. Can either be a comma-separated list (e.g. 0,1,2) '
-            'or a range (e.g. 0-2) or any combination of the two (e.g. 0-2,5,7-9). If not set, '
-            'all instances will be acted on.')
-    parser.add_argument('--config', type=str, default=None, dest='config',
-         help='Config file for the job, possibly containing hooks')
+    self.add_option(parser, INSTANCES_OPTION)
+    self.add_option(parser, CONFIG_FILE_OPTION)
     self.add_option(parser, JOBSPEC_OPTION)
 
   def execute(self, context):
@@ -14,8 +14,6 @@ import time
 from tempfile import NamedTemporaryFile
 
 from twitter.common import app, log
-from twitter.common.python.pex import PexInfo
-from twitter.common.python.dirwrapper import PythonDirectoryWrapper
 
 from apache.aurora.client.base import (
     check_and_log_response,
@@ -59,14 +57,8 @@ def get_job_config(job_spec, config_file, options):
     select_env = options.env
     select_role = None
     jobname = job_spec
-  try:
-    json_option = options.json
-  except AttributeError:
-    json_option = False
-  try:
-    bindings = options.bindings
-  except AttributeError:
-    bindings = ()
+  json_option = getattr(options, 'json', False)
+  bindings = getattr(options, 'bindings', ())
   return get_config(
       jobname,
       config_file,
@@ -82,6 +74,8 @@ def version(args):
 
   Prints information about the version of the aurora client being run.
   """
+  from twitter.common.python.dirwrapper import PythonDirectoryWrapper
+  from twitter.common.python.pex import PexInfo
   try:
     pexpath = sys.argv[0]
     pex_info = PexInfo.from_pex(PythonDirectoryWrapper.get(pexpath))
@@ -164,11 +158,13 @@ def diff(job_spec, config_file):
         data=json.loads(task.executorConfig.data))
     return pp.pformat(vars(task))
 
-  def pretty_print_tasks(tasks):
-    return ',\n'.join([pretty_print_task(t) for t in tasks])
-
   def dump_tasks(tasks, out_file):
-    out_file.write(pretty_print_tasks(tasks))
+    # Write each task as it is formatted rather than joining them into one
+    # large string, keeping peak memory proportional to a single task.
+    for index, task in enumerate(tasks):
+      if index:
+        out_file.write(',\n')
+      out_file.write(pretty_print_task(task))
     out_file.write('\n')
     out_file.flush()
 
@@ -237,9 +233,9 @@ def inspect(job_spec, config_file):
     print('Parsed job config: %s' % config.job())
     return
 
+  # config.job() does a full thrift conversion of the config; do it once.
   job_thrift = config.job()
   job = config.raw()
-  job_thrift = config.job()
   print('Job level information')
   print('  name:       %s' % job.name())
   print('  role:       %s' % job.role())
@@ -378,45 +374,49 @@ def status(args, options):
 
   Fetches and prints information about the active tasks in a job.
   """
-  def is_active(task):
-    return task.status in ACTIVE_STATES
+  # Bind the thrift value->name mapping once rather than resolving it through the
+  # module namespace for every task and task event.
+  status_names = ScheduleStatus._VALUES_TO_NAMES
 
   def print_task(scheduled_task):
     assigned_task = scheduled_task.assignedTask
     taskInfo = assigned_task.task
-    taskString = ''
+    # Collect the pieces and join once, rather than growing a string with +=.
+    parts = []
     if taskInfo:
-      taskString += '''cpus: %s, ram: %s MB, disk: %s MB''' % (taskInfo.numCpus,
-                                                               taskInfo.ramMb,
-                                                               taskInfo.diskMb)
+      parts.append('''cpus: %s, ram: %s MB, disk: %s MB''' % (taskInfo.numCpus,
+                                                              taskInfo.ramMb,
+                                                              taskInfo.diskMb))
     if assigned_task.assignedPorts:
-      taskString += '\n\tports: %s' % assigned_task.assignedPorts
-    taskString += '\n\tfailure count: %s (max %s)' % (scheduled_task.failureCount,
-                                                      taskInfo.maxTaskFailures)
-    taskString += '\n\tevents:'
+      parts.append('\n\tports: %s' % assigned_task.assignedPorts)
+    parts.append('\n\tfailure count: %s (max %s)' % (scheduled_task.failureCount,
+                                                     taskInfo.maxTaskFailures))
+    parts.append('\n\tevents:')
     for event in scheduled_task.taskEvents:
-      taskString += '\n\t\t %s %s: %s' % (datetime.fromtimestamp(event.timestamp / 1000),
-                                          ScheduleStatus._VALUES_TO_NAMES[event.status],
-                                          event.message)
-    taskString += '\n\tpackages:'
+      parts.append('\n\t\t %s %s: %s' % (datetime.fromtimestamp(event.timestamp / 1000),
+                                         status_names[event.status],
+                                         event.message))
+    parts.append('\n\tpackages:')
     for pkg in assigned_task.task.packages:
-      taskString += ('\n\t\trole: %s, package: %s, version: %s' % (pkg.role, pkg.name, pkg.version))
+      parts.append('\n\t\trole: %s, package: %s, version: %s' % (pkg.role, pkg.name, pkg.version))
 
-    return taskString
+    return ''.join(parts)
 
   def print_tasks(tasks):
     for task in tasks:
       taskString = print_task(task)
 
+      assigned_task = task.assignedTask
+      taskInfo = assigned_task.task
       log.info('role: %s, env: %s, name: %s, shard: %s, status: %s on %s\n%s' %
-             (task.assignedTask.task.owner.role,
-              task.assignedTask.task.environment,
-              task.assignedTask.task.jobName,
-              task.assignedTask.instanceId,
-              ScheduleStatus._VALUES_TO_NAMES[task.status],
-              task.assignedTask.slaveHost,
+             (taskInfo.owner.role,
+              taskInfo.environment,
+              taskInfo.jobName,
+              assigned_task.instanceId,
+              status_names[task.status],
+              assigned_task.slaveHost,
               taskString))
-      for pkg in task.assignedTask.task.packages:
+      for pkg in taskInfo.packages:
         log.info('\tpackage %s/%s/%s' % (pkg.role, pkg.name, pkg.version))
 
   api, job_key, _ = LiveJobDisambiguator.disambiguate_args_or_die(
@@ -426,10 +426,11 @@ def status(args, options):
 
   tasks = resp.result.scheduleStatusResult.tasks
   if tasks:
-    active_tasks = filter(is_active, tasks)
+    active_tasks, inactive_tasks = [], []
+    for task in tasks:
+      (active_tasks if task.status in ACTIVE_STATES else inactive_tasks).append(task)
     log.info('Active Tasks (%s)' % len(active_tasks))
     print_tasks(active_tasks)
-    inactive_tasks = filter(lambda x: not is_active(x), tasks)
     log.info('Inactive Tasks (%s)' % len(inactive_tasks))
     print_tasks(inactive_tasks)
   else:
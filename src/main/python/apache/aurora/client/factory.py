@@ -12,8 +12,9 @@ from .base import die
 # These are currently necessary indirections for the LiveJobDisambiguator among
 # other things but can go away once those are scrubbed.
 
-def make_client_factory():
-  verbose = getattr(app.get_options(), 'verbosity', 'normal') == 'verbose'
+def make_client_factory(verbose=None):
+  if verbose is None:
+    verbose = getattr(app.get_options(), 'verbosity', 'normal') == 'verbose'
   class TwitterAuroraClientAPI(HookedAuroraClientAPI):
     def __init__(self, cluster, *args, **kw):
       if cluster not in CLUSTERS:
@@ -22,6 +23,24 @@ def make_client_factory():
   return functools.partial(TwitterAuroraClientAPI, verbose=verbose)
 
 
+_CLIENT_CACHE = {}
+
+
+def clear_client_cache():
+  """Drop all cached client handles.  Needed whenever the scheduler wiring
+  underneath a handle may have changed, e.g. between tests that patch it."""
+  _CLIENT_CACHE.clear()
+
+
 def make_client(cluster):
-  factory = make_client_factory()
-  return factory(cluster.name if isinstance(cluster, Cluster) else cluster)
+  """Return a client API handle for a cluster, reusing a previously constructed
+  handle when possible.  Construction resolves the scheduler endpoint (possibly
+  through zookeeper), so handles are cached per (cluster, verbosity) and shared
+  by commands dispatched within the same process."""
+  verbose = getattr(app.get_options(), 'verbosity', 'normal') == 'verbose'
+  cluster_name = cluster.name if isinstance(cluster, Cluster) else cluster
+  key = (cluster_name, verbose)
+  client = _CLIENT_CACHE.get(key)
+  if client is None:
+    client = _CLIENT_CACHE[key] = make_client_factory(verbose)(cluster_name)
+  return client
@@ -19,6 +19,13 @@ try:
 except ImportError:
   HAS_YAML = False
 
+if HAS_YAML:
+  def yaml_load(fp):
+    # Prefer the libyaml-backed loader when PyYAML was compiled with it; it
+    # parses an order of magnitude faster than the pure-python loader.
+    # Clusters files are plain mappings, so the safe loader suffices.
+    return yaml.load(fp, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
 
 __all__ = (
   'CLUSTERS',
@@ -42,7 +49,7 @@ class Clusters(Mapping):
 
   LOADERS = {'.json': Parser(json.load, ValueError)}
   if HAS_YAML:
-    LOADERS['.yml'] = Parser(yaml.load, yaml.parser.ParserError)
+    LOADERS['.yml'] = Parser(yaml_load, yaml.parser.ParserError)
 
   @classmethod
   def from_file(cls, filename):
@@ -51,22 +58,25 @@ class Clusters(Mapping):
   @classmethod
   def iter_clusters(cls, filename):
     _, ext = os.path.splitext(filename)
-    if ext not in cls.LOADERS:
+    parser = cls.LOADERS.get(ext)
+    if parser is None:
       raise cls.UnknownFormatError('Unknown clusters file extension: %r' % ext)
     with open(filename) as fp:
-      loader, exc_type = cls.LOADERS[ext]
+      loader, exc_type = parser
       try:
         document = loader(fp)
       except exc_type as e:
         raise cls.ParseError('Unable to parse %s: %s' % (filename, e))
-      if isinstance(document, list):
+      # The json/yaml parsers hand back exact builtin types, so the cheaper
+      # exact-type check suffices here.
+      if type(document) is list:
         iterator = document
-      elif isinstance(document, dict):
+      elif type(document) is dict:
         iterator = document.values()
       else:
         raise cls.ParseError('Unknown layout in %s' % filename)
       for document in iterator:
-        if not isinstance(document, dict):
+        if type(document) is not dict:
           raise cls.ParseError('Clusters must be maps of key/value pairs, got %s' % type(document))
         # documents not adhering to NameTrait are ignored.
         if 'name' not in document:
@@ -1,6 +1,6 @@
 from __future__ import absolute_import
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from apache.aurora.common.aurora_job_key import AuroraJobKey
 from apache.aurora.config.schema.base import MesosContext
@@ -55,6 +55,18 @@ class AuroraConfig(object):
       return select_role is None or str(job.role()) == select_role
 
     bound_jobs = map(maybe_bind, job_list)
+
+    # Jobs sharing a full key can never be disambiguated; catch them in a
+    # single counting pass before matching instead of only when the
+    # colliding name happens to be requested.
+    key_counts = Counter(
+        (str(j.cluster()), str(j.role()), str(j.environment()), str(j.name()))
+        for j in bound_jobs)
+    duplicates = [key for key, count in key_counts.items() if count > 1]
+    if duplicates:
+      raise ValueError('Duplicate job(s) in this config: %s' %
+          ', '.join('/'.join(key) for key in duplicates))
+
     matches = [j for j in bound_jobs if
                all([match_cluster(j), match_role(j), match_env(j), match_name(j)])]
 
@@ -117,21 +129,23 @@ class AuroraConfig(object):
     job = AuroraConfigLoader.loads_json(string)
     return cls.apply_plugins(cls(job.bind(*bindings) if bindings else job))
 
+  REQUIRED_JOB_FIELDS = ('cluster', 'task', 'role')
+
   @classmethod
   def validate_job(cls, job):
     """
       Validate and sanitize the input job
 
       Currently, the validation stage simply ensures that the job has all required fields.
-      self.InvalidConfig is raised if any required fields are not present.
+      self.InvalidConfig is raised if any required fields are not present, reporting
+      every missing field at once rather than one per load attempt.
     """
-    def has(pystachio_type, thing):
-      return getattr(pystachio_type, 'has_%s' % thing)()
-    for required in ("cluster", "task", "role"):
-      if not has(job, required):
-        raise cls.InvalidConfig(
-          '%s required for job "%s"' % (required.capitalize(), job.name()))
-    if not has(job.task(), 'processes'):
+    errors = ['%s required for job "%s"' % (required.capitalize(), job.name())
+              for required in cls.REQUIRED_JOB_FIELDS
+              if not getattr(job, 'has_%s' % required)()]
+    if errors:
+      raise cls.InvalidConfig('\n'.join(errors))
+    if not job.task().has_processes():
       raise cls.InvalidConfig('Processes required for task on job "%s"' % job.name())
 
   @classmethod
@@ -1,8 +1,10 @@
 import json
+import os
 import pkgutil
 import textwrap
 
 from apache.aurora.config.schema import base as base_schema
+from twitter.common.lang import Compatibility
 
 from pystachio.config import Config as PystachioConfig
 
@@ -10,6 +12,13 @@ from pystachio.config import Config as PystachioConfig
 class AuroraConfigLoader(PystachioConfig):
   SCHEMA_MODULES = []
 
+  # Environments from named files, keyed by root file realpath and the schema
+  # in effect, each entry carrying a (path, mtime, size) snapshot of every
+  # file the config was compiled from.  A hit skips the read/compile/exec of
+  # the config entirely, which dominates the cost of repeat loads in one
+  # process.
+  _CACHED_ENVIRONMENTS = {}
+
   @classmethod
   def assembled_schema(cls, schema_modules):
     default_schema = [super(AuroraConfigLoader, cls).DEFAULT_SCHEMA]
@@ -42,9 +51,51 @@ class AuroraConfigLoader(PystachioConfig):
     cls.SCHEMA_MODULES = []
     cls.register_schema(base_schema)
 
+  @classmethod
+  def _dependency_stats(cls, config):
+    """Snapshot (path, mtime, size) for every file the config was compiled
+       from: the root and anything pulled in via include()."""
+    stats = []
+    for key in config.loadables:
+      from_path, _, include_string = key.partition('\0')
+      path = os.path.join(os.path.dirname(from_path), include_string)
+      stat = os.stat(path)
+      stats.append((path, stat.st_mtime, stat.st_size))
+    return tuple(sorted(stats))
+
+  @classmethod
+  def _stats_current(cls, stats):
+    try:
+      for path, mtime, size in stats:
+        stat = os.stat(path)
+        if stat.st_mtime != mtime or stat.st_size != size:
+          return False
+    except OSError:
+      return False
+    return True
+
   @classmethod
   def load(cls, loadable):
-    return cls.load_raw(loadable).environment
+    if not isinstance(loadable, Compatibility.string) or not os.path.isfile(loadable):
+      # Filelike objects, loadable maps and missing files take the uncached
+      # path, the latter so the usual NotFound is raised.
+      return cls.load_raw(loadable).environment
+    key = (os.path.realpath(loadable), hash(cls.DEFAULT_SCHEMA))
+    entry = cls._CACHED_ENVIRONMENTS.get(key)
+    if entry is None or not cls._stats_current(entry[0]):
+      config = cls.load_raw(loadable)
+      try:
+        entry = cls._CACHED_ENVIRONMENTS[key] = (cls._dependency_stats(config), config.environment)
+      except OSError:
+        # Sources that cannot be stat'ed (e.g. package resources) are not
+        # cacheable.
+        return config.environment
+    # Callers own the returned environment and may rebind jobs in place, so
+    # hand out a copy with a fresh job list rather than the cached one.
+    env = entry[1].copy()
+    if 'jobs' in env:
+      env['jobs'] = list(env['jobs'])
+    return env
 
   @classmethod
   def load_raw(cls, loadable):
@@ -149,12 +149,21 @@ ALIASED_FIELDS = (
 )
 
 
+# The same erasure mapping applies to every job; build it once and share it
+# (the ** expansion copies it into each call's keyword dict).
+EMPTY_ALIASED_FIELDS = dict((key, Empty) for key in ALIASED_FIELDS)
+
+
 def filter_aliased_fields(job):
-  return job(**dict((key, Empty) for key in ALIASED_FIELDS))
+  return job(**EMPTY_ALIASED_FIELDS)
+
+
+VALID_IDENTIFIER = re.compile(GOOD_IDENTIFIER_PATTERN_PYTHON)
+
+MB = 1024 * 1024
 
 
 def assert_valid_field(field, identifier):
-  VALID_IDENTIFIER = re.compile(GOOD_IDENTIFIER_PATTERN_PYTHON)
   if not isinstance(identifier, Compatibility.string):
     raise InvalidConfig("%s must be a string" % field)
   if not VALID_IDENTIFIER.match(identifier):
@@ -172,23 +181,41 @@ THERMOS_TASK_ID_REF = Ref.from_address('thermos.task_id')
 def convert(job, packages=frozenset(), ports=frozenset()):
   """Convert a Pystachio MesosJob to an Aurora Thrift JobConfiguration."""
 
-  owner = Identity(role=fully_interpolated(job.role()), user=getpass.getuser())
+  # Interpolate each job-level field once; every fully_interpolated call
+  # re-runs a typecheck and interpolation on the wrapped object.
+  job_role = fully_interpolated(job.role())
+  job_environment = fully_interpolated(job.environment())
+  job_name = fully_interpolated(job.name())
+
+  owner = Identity(role=job_role, user=getpass.getuser())
   key = JobKey(
-    role=assert_valid_field('role', fully_interpolated(job.role())),
-    environment=assert_valid_field('environment', fully_interpolated(job.environment())),
-    name=assert_valid_field('name', fully_interpolated(job.name())))
+    role=assert_valid_field('role', job_role),
+    environment=assert_valid_field('environment', job_environment),
+    name=assert_valid_field('name', job_name))
 
   task_raw = job.task()
 
-  MB = 1024 * 1024
+  # Surface fatally malformed resources before doing any per-field
+  # interpolation; this bounds the work spent on configs that are doomed
+  # to be rejected and costs nothing on the happy path.
+  if not task_raw.has_resources():
+    raise InvalidConfig('Task must specify resources!')
+
+  resources = task_raw.resources()
+  ram_bytes = fully_interpolated(resources.ram())
+  disk_bytes = fully_interpolated(resources.disk())
+  if ram_bytes == 0 or disk_bytes == 0:
+    raise InvalidConfig('Must specify ram and disk resources, got ram:%r disk:%r' % (
+      ram_bytes, disk_bytes))
+
   task = TaskConfig()
 
   def not_empty_or(item, default):
     return default if item is Empty else fully_interpolated(item)
 
   # job components
-  task.jobName = fully_interpolated(job.name())
-  task.environment = fully_interpolated(job.environment())
+  task.jobName = job_name
+  task.environment = job_environment
   task.production = fully_interpolated(job.production(), bool)
   task.isService = select_service_bit(job)
   task.maxTaskFailures = fully_interpolated(job.max_task_failures())
@@ -201,18 +228,9 @@ def convert(job, packages=frozenset(), ports=frozenset()):
       for role, package_name, version in packages)
 
   # task components
-  if not task_raw.has_resources():
-    raise InvalidConfig('Task must specify resources!')
-
-  if (fully_interpolated(task_raw.resources().ram()) == 0
-      or fully_interpolated(task_raw.resources().disk()) == 0):
-    raise InvalidConfig('Must specify ram and disk resources, got ram:%r disk:%r' % (
-      fully_interpolated(task_raw.resources().ram()),
-      fully_interpolated(task_raw.resources().disk())))
-
-  task.numCpus = fully_interpolated(task_raw.resources().cpu())
-  task.ramMb = fully_interpolated(task_raw.resources().ram()) / MB
-  task.diskMb = fully_interpolated(task_raw.resources().disk()) / MB
+  task.numCpus = fully_interpolated(resources.cpu())
+  task.ramMb = ram_bytes / MB
+  task.diskMb = disk_bytes / MB
   if task.numCpus <= 0 or task.ramMb <= 0 or task.diskMb <= 0:
     raise InvalidConfig('Task has invalid resources.  cpu/ramMb/diskMb must all be positive: '
         'cpu:%r ramMb:%r diskMb:%r' % (task.numCpus, task.ramMb, task.diskMb))
@@ -84,12 +84,13 @@ class HealthCheckerProvider(StatusCheckerProvider):
     mesos_task = mesos_task_instance_from_assigned_task(assigned_task)
     portmap = resolve_ports(mesos_task, assigned_task.assignedPorts)
 
-    if 'health' not in portmap:
+    health_port = portmap.get('health')
+    if health_port is None:
       return None
 
     health_check_config = mesos_task.health_check_config().get()
     http_signaler = HttpSignaler(
-        portmap['health'],
+        health_port,
         timeout_secs=health_check_config.get('timeout_secs'))
     health_checker = HealthCheckerThread(
         http_signaler.health,
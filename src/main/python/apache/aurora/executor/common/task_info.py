@@ -31,7 +31,9 @@ def mesos_job_from_assigned_task(assigned_task):
   if 'instance' in json_blob:
     # This is a MesosTaskInstance so we cannot get a MesosJob from this assigned_task
     return None
-  return MesosJob.json_loads(thermos_task)
+  # Build the struct from the blob we already parsed instead of re-parsing the
+  # JSON, dropping unknown keys as json_loads would for forward compatibility.
+  return MesosJob(MesosJob._filter_against_schema(json_blob))
 
 
 def mesos_task_instance_from_assigned_task(assigned_task):
@@ -51,10 +53,11 @@ def mesos_task_instance_from_assigned_task(assigned_task):
   # is using MesosJob, then we can begin to leverage additional information that
   # becomes available such as cluster.
   if 'instance' in json_blob:
-    return MesosTaskInstance.json_loads(thermos_task)
+    return MesosTaskInstance(MesosTaskInstance._filter_against_schema(json_blob))
 
   # This is a MesosJob
-  mti, refs = task_instance_from_job(MesosJob.json_loads(thermos_task), assigned_task.instanceId)
+  mti, refs = task_instance_from_job(
+      MesosJob(MesosJob._filter_against_schema(json_blob)), assigned_task.instanceId)
   for ref in refs:
     # If the ref is {{thermos.task_id}} or a subscope of
     # {{thermos.ports}}, it currently gets bound by the Thermos Runner,
@@ -87,11 +87,16 @@ class ExecutorVars(Observable, ExceptionalThread):
 
   @classmethod
   def aggregate_memory(cls, process, attribute='pss'):
+    # A plain loop over the maps avoids the generator trampoline inside sum(),
+    # which adds up on processes with many mappings sampled every interval.
+    total = 0
     try:
-      return sum(getattr(mmap, attribute) for mmap in process.get_memory_maps())
+      for mmap in process.get_memory_maps():
+        total += getattr(mmap, attribute)
     except (psutil.Error, AttributeError):
       # psutil on OS X does not support get_memory_maps
       return 0
+    return total
 
   @classmethod
   def cpu_rss_pss(cls, process):
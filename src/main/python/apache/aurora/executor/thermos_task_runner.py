@@ -93,10 +93,11 @@ class ThermosTaskRunner(TaskRunner):
       raise TaskError('Failed to load task: %s' % e)
 
   def _terminate_http(self):
-    if 'health' not in self._ports:
+    health_port = self._ports.get('health')
+    if health_port is None:
       return
 
-    http_signaler = HttpSignaler(self._ports['health'])
+    http_signaler = HttpSignaler(health_port)
 
     # pass 1
     http_signaler.quitquitquit()
@@ -638,7 +638,7 @@ commands:
 """
 
   for (command, doc) in app.get_commands_and_docstrings():
-    usage += '    ' + '%-10s' % command + '\t' + doc.split('\n')[0].strip() + '\n'
+    usage += '    ' + '%-10s' % command + '\t' + doc.partition('\n')[0].strip() + '\n'
   app.set_usage(usage)
 
 
@@ -155,10 +155,52 @@ class ThermosConfigLoader(object):
       __TASKS.append(Task(task) if isinstance(task, dict) else task)
   """)
 
+  # Task structs exported by named files, keyed by root file realpath, each
+  # entry carrying a (path, mtime, size) snapshot of every file the config
+  # was compiled from.  Tasks are immutable pystachio structs, so repeat
+  # loads of unchanged files can share them and skip re-evaluating the
+  # config.
+  _CACHED_TASKS = {}
+
+  @classmethod
+  def _dependency_stats(cls, config):
+    """Snapshot (path, mtime, size) for every file the config was compiled
+       from: the root and anything pulled in via include()."""
+    stats = []
+    for key in config.loadables:
+      from_path, _, include_string = key.partition('\0')
+      path = os.path.join(os.path.dirname(from_path), include_string)
+      stat = os.stat(path)
+      stats.append((path, stat.st_mtime, stat.st_size))
+    return tuple(sorted(stats))
+
+  @classmethod
+  def _stats_current(cls, stats):
+    try:
+      for path, mtime, size in stats:
+        stat = os.stat(path)
+        if stat.st_mtime != mtime or stat.st_size != size:
+          return False
+    except OSError:
+      return False
+    return True
+
   @classmethod
   def load(cls, loadable, **kw):
-    config = Config(loadable, schema=cls.SCHEMA)
-    return cls(ThermosTaskWrapper(task, **kw) for task in config.environment['__TASKS'])
+    if not isinstance(loadable, Compatibility.string) or not os.path.isfile(loadable):
+      tasks = Config(loadable, schema=cls.SCHEMA).environment['__TASKS']
+      return cls(ThermosTaskWrapper(task, **kw) for task in tasks)
+    key = os.path.realpath(loadable)
+    entry = cls._CACHED_TASKS.get(key)
+    if entry is None or not cls._stats_current(entry[0]):
+      config = Config(loadable, schema=cls.SCHEMA)
+      tasks = list(config.environment['__TASKS'])
+      try:
+        entry = cls._CACHED_TASKS[key] = (cls._dependency_stats(config), tasks)
+      except OSError:
+        # Sources that cannot be stat'ed are not cacheable.
+        return cls(ThermosTaskWrapper(task, **kw) for task in tasks)
+    return cls(ThermosTaskWrapper(task, **kw) for task in entry[1])
 
   @classmethod
   def load_json(cls, filename, **kw):
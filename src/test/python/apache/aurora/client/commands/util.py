@@ -1,5 +1,6 @@
 import unittest
 
+from apache.aurora.client.factory import clear_client_cache
 from apache.aurora.client.hooks.hooked_api import HookedAuroraClientAPI
 from apache.aurora.common.cluster import Cluster
 from apache.aurora.common.clusters import Clusters
@@ -14,6 +15,11 @@ from mock import Mock
 
 
 class AuroraClientCommandTest(unittest.TestCase):
+  def setUp(self):
+    # Client handles are cached per process, but each test patches its own
+    # scheduler wiring, so a handle from a previous test must not leak in.
+    clear_client_cache()
+
   @classmethod
   def create_blank_response(cls, code, msg):
     response = Mock(spec=Response)
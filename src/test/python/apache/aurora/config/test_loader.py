@@ -1,7 +1,8 @@
 import json
+import os
 import tempfile
 
-from twitter.common.contextutil import temporary_file
+from twitter.common.contextutil import temporary_dir, temporary_file
 
 from apache.aurora.config import AuroraConfig
 from apache.aurora.config.loader import AuroraConfigLoader
@@ -76,6 +77,46 @@ def test_load():
       assert hello_world.name().get() == 'hello_world'
 
 
+def test_load_cached():
+  with temporary_file() as fp:
+    fp.write(MESOS_CONFIG)
+    fp.flush()
+
+    env = AuroraConfigLoader.load(fp.name)
+    cached_env = AuroraConfigLoader.load(fp.name)
+    assert cached_env is not env
+    assert cached_env['jobs'] == env['jobs']
+
+    # Returned job lists belong to the caller; mutating one must not pollute
+    # subsequent loads.
+    cached_env['jobs'].pop()
+    assert len(AuroraConfigLoader.load(fp.name)['jobs']) == 1
+
+    # Rewriting the file invalidates the cached environment.
+    with open(fp.name, 'w') as rewrite_fp:
+      rewrite_fp.write(MESOS_CONFIG.replace("name = 'hello_world',", "name = 'goodbye_world',"))
+    assert AuroraConfigLoader.load(fp.name)['jobs'][0].name().get() == 'goodbye_world'
+
+
+def test_load_cached_tracks_includes():
+  with temporary_dir() as dirpath:
+    include_path = os.path.join(dirpath, 'include.aurora')
+    root_path = os.path.join(dirpath, 'root.aurora')
+    with open(include_path, 'w') as fp:
+      fp.write('JOB_NAME = "hello_world"\n')
+    with open(root_path, 'w') as fp:
+      fp.write('include("include.aurora")\n')
+      fp.write(MESOS_CONFIG.replace("name = 'hello_world',", 'name = JOB_NAME,'))
+
+    assert AuroraConfigLoader.load(root_path)['jobs'][0].name().get() == 'hello_world'
+
+    # Editing an included file must invalidate the root's cached environment
+    # even though the root file's stat is unchanged.
+    with open(include_path, 'w') as fp:
+      fp.write('JOB_NAME = "goodbye_world"\n')
+    assert AuroraConfigLoader.load(root_path)['jobs'][0].name().get() == 'goodbye_world'
+
+
 def test_pick():
   with temporary_file() as fp:
     fp.write(MESOS_CONFIG)
@@ -88,3 +129,26 @@ def test_pick():
   env['jobs'][0] = env['jobs'][0](name = 'something_{{else}}')
   assert str(AuroraConfig.pick(env, 'something_else', [{'else': 'else'}]).name()) == (
       'something_else')
+
+
+def test_pick_duplicate_jobs():
+  with temporary_file() as fp:
+    fp.write(MESOS_CONFIG + 'jobs = [HELLO_WORLD, HELLO_WORLD]\n')
+    fp.flush()
+    env = AuroraConfigLoader.load(fp.name)
+
+  with pytest.raises(ValueError) as excinfo:
+    AuroraConfig.pick(env, 'hello_world', None)
+  assert 'Duplicate job' in str(excinfo.value)
+
+
+def test_pick_duplicate_names_distinct_keys():
+  # The same job name in different environments is not a duplicate.
+  with temporary_file() as fp:
+    fp.write(MESOS_CONFIG +
+        "jobs = [HELLO_WORLD(environment = 'staging'), HELLO_WORLD(environment = 'prod')]\n")
+    fp.flush()
+    env = AuroraConfigLoader.load(fp.name)
+
+  picked = AuroraConfig.pick(env, 'hello_world', None, select_env='prod')
+  assert str(picked.environment()) == 'prod'
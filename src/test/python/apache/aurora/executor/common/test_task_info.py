@@ -1,4 +1,5 @@
 import getpass
+import json
 
 from apache.aurora.config.schema.base import (
     MB,
@@ -46,3 +47,21 @@ def test_deserialize_thermos_task():
     executorConfig=ExecutorConfig(name='thermos', data=HELLO_WORLD_MTI.json_dumps()))
   assigned_task = AssignedTask(task=task_config, instanceId=0)
   assert mesos_task_instance_from_assigned_task(assigned_task) == BASE_MTI(task=HELLO_WORLD)
+
+
+def test_deserialize_thermos_task_tolerates_unknown_fields():
+  # A newer client may serialize fields this executor does not know about;
+  # they must be dropped rather than crash deserialization.
+  job_blob = json.loads(MESOS_JOB(task=HELLO_WORLD).json_dumps())
+  job_blob['unknown_future_field'] = 1
+  task_config = TaskConfig(
+      executorConfig=ExecutorConfig(name='thermos', data=json.dumps(job_blob)))
+  assigned_task = AssignedTask(task=task_config, instanceId=0)
+  assert mesos_task_instance_from_assigned_task(assigned_task) == BASE_MTI(task=HELLO_WORLD)
+
+  mti_blob = json.loads(HELLO_WORLD_MTI.json_dumps())
+  mti_blob['unknown_future_field'] = 1
+  task_config = TaskConfig(
+    executorConfig=ExecutorConfig(name='thermos', data=json.dumps(mti_blob)))
+  assigned_task = AssignedTask(task=task_config, instanceId=0)
+  assert mesos_task_instance_from_assigned_task(assigned_task) == BASE_MTI(task=HELLO_WORLD)
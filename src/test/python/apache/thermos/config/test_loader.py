@@ -0,0 +1,49 @@
+import os
+
+from twitter.common.contextutil import temporary_dir
+
+from apache.thermos.config.loader import ThermosConfigLoader
+
+
+TASK_CONFIG = """
+export(Task(
+  name = %(name)s,
+  processes = [Process(name = 'hello_world', cmdline = 'echo hello world')],
+))
+"""
+
+
+def write(path, contents):
+  with open(path, 'w') as fp:
+    fp.write(contents)
+
+
+def test_load_cached():
+  with temporary_dir() as dirpath:
+    path = os.path.join(dirpath, 'config.thermos')
+    write(path, TASK_CONFIG % {'name': "'hello_world'"})
+
+    first = ThermosConfigLoader.load(path).tasks()
+    second = ThermosConfigLoader.load(path).tasks()
+    assert len(first) == 1 and len(second) == 1
+    # A hit shares the immutable task structs instead of re-evaluating.
+    assert second[0].task is first[0].task
+
+    # Rewriting the file invalidates the cached tasks.
+    write(path, TASK_CONFIG % {'name': "'goodbye_world'"})
+    assert ThermosConfigLoader.load(path).tasks()[0].task.name().get() == 'goodbye_world'
+
+
+def test_load_cached_tracks_includes():
+  with temporary_dir() as dirpath:
+    include_path = os.path.join(dirpath, 'include.thermos')
+    root_path = os.path.join(dirpath, 'root.thermos')
+    write(include_path, 'TASK_NAME = "hello_world"\n')
+    write(root_path, 'include("include.thermos")\n' + TASK_CONFIG % {'name': 'TASK_NAME'})
+
+    assert ThermosConfigLoader.load(root_path).tasks()[0].task.name().get() == 'hello_world'
+
+    # Editing an included file must invalidate the root's cached tasks even
+    # though the root file's stat is unchanged.
+    write(include_path, 'TASK_NAME = "goodbye_world"\n')
+    assert ThermosConfigLoader.load(root_path).tasks()[0].task.name().get() == 'goodbye_world'